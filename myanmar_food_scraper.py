@@ -7,31 +7,288 @@ Each food type is saved in its own folder
 
 from selenium import webdriver
 from selenium.webdriver.common.by import By
-from selenium.webdriver.chrome.service import Service
-from webdriver_manager.chrome import ChromeDriverManager
-import time
-import requests
+from PIL import Image
+import aiohttp
+import asyncio
 import os
+import signal
+import time
+import re
+import json
+import atexit
+import threading
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-from urllib.parse import urlparse
+from selenium.common.exceptions import TimeoutException
+from concurrent.futures import CancelledError as FuturesCancelledError
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+from multiprocessing import Pool
+from multiprocessing.util import Finalize
 import logging
 
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Streaming download settings
+CHUNK_SIZE = 64 * 1024           # Bytes read from the socket per iteration
+MAX_IMAGE_BYTES = 10_000_000     # Abort downloads larger than this
+
+# Downloaded-URL cache, stored inside the base folder. Each process appends
+# to its own shard; shards are merged into URL_CACHE_FILE when no worker runs.
+URL_CACHE_FILE = ".url_cache.json"
+URL_CACHE_SHARD_RE = re.compile(r'^\.url_cache\.\d+\.json$')
+URL_CACHE_FLUSH_EVERY = 25       # Persist the cache after this many new downloads
+
+# HTTP client settings
+# Desktop Chrome UA, used by both the browser (headless Chrome otherwise
+# advertises "HeadlessChrome") and the image downloader
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/141.0.0.0 Safari/537.36'
+REQUEST_HEADERS = {
+    'User-Agent': USER_AGENT
+}
+CONNECTIONS_PER_HOST = 8
+DNS_CACHE_TTL = 300              # Seconds to cache resolved hostnames
+DOWNLOAD_TIMEOUT = 10            # Total seconds allowed per image
+URL_QUEUE_SIZE = 200             # Scraped URLs waiting for the downloader
+HEAD_TIMEOUT = 5                 # Total seconds allowed per HEAD pre-check
+MIN_IMAGE_BYTES = 5_000          # Smaller images are icons/thumbnails
+
+# Re-encoding of downloaded images
+WEBP_QUALITY = 85
+WEBP_METHOD = 4                  # Encoder effort (0 fast .. 6 small)
+MAX_IMAGE_SIDE = 1024            # Longest side after resizing, in pixels
+
+# Leading bytes used to identify image formats
+MAGIC_HEADER_SIZE = 12
+JPEG_MAGIC = b'\xff\xd8\xff'
+PNG_MAGIC = b'\x89PNG\r\n\x1a\n'
+
+# Collects the URL of every <img> on the page as a JSON string; evaluated via
+# CDP Runtime.evaluate, so it is an expression rather than a function body
+EXTRACT_IMAGE_URLS_EXPR = (
+    "JSON.stringify(Array.from(document.images, "
+    "i => i.currentSrc || i.src || i.dataset.src).filter(Boolean))"
+)
+
+# Clicks the "Show more results" button if present and visible; returns bool
+CLICK_SHOW_MORE_JS = """
+const b = document.querySelector('input[value="Show more results"]');
+if (b && b.offsetParent) { b.click(); return true; }
+return false;
+"""
+
+# Number of network requests the page has made so far
+RESOURCE_COUNT_JS = "return performance.getEntriesByType('resource').length"
+
+# http(s) URLs, excluding SVG/GIF icons. Google thumbnails often have no file
+# extension, so URLs without one are accepted.
+VALID_IMAGE_URL_RE = re.compile(
+    r'^https?://(?![^?#]*\.(?:svg|gif)(?:[?#]|$))\S+$', re.IGNORECASE
+)
+
+def _sniff_image_extension(head):
+    """
+    Identify an image format from its leading bytes
+    
+    Args:
+        head (bytes): First MAGIC_HEADER_SIZE bytes of the file
+        
+    Returns:
+        str: File extension ('.jpg', '.png' or '.webp'), or None if not an image
+    """
+    if head.startswith(JPEG_MAGIC):
+        return '.jpg'
+    if head.startswith(PNG_MAGIC):
+        return '.png'
+    if head.startswith(b'RIFF') and head[8:12] == b'WEBP':
+        return '.webp'
+    return None
+
+
+def _convert_to_webp(file_path):
+    """
+    Re-encode a downloaded image as WebP, shrinking it to MAX_IMAGE_SIDE
+    
+    The original file is replaced by the WebP file.
+    
+    Args:
+        file_path (str): Path of the downloaded image
+        
+    Returns:
+        str: Path of the WebP image
+    """
+    webp_path = os.path.splitext(file_path)[0] + '.webp'
+    
+    with Image.open(file_path) as img:
+        # Already a small enough WebP; re-encoding would only lose quality
+        if img.format == 'WEBP' and max(img.size) <= MAX_IMAGE_SIDE:
+            return file_path
+        
+        img = img.convert('RGB')
+        img.thumbnail((MAX_IMAGE_SIDE, MAX_IMAGE_SIDE), Image.Resampling.LANCZOS)
+        
+        tmp_path = f"{webp_path}.tmp"
+        try:
+            img.save(tmp_path, 'WEBP', quality=WEBP_QUALITY, method=WEBP_METHOD)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+    
+    os.replace(tmp_path, webp_path)
+    if file_path != webp_path:
+        os.remove(file_path)
+    return webp_path
+
+
+class _UrlFeed:
+    """
+    Hands image URLs from the Selenium thread to the download event loop
+    
+    The queue is bounded so scrolling pauses when downloads fall behind.
+    `done` is set once the downloader no longer needs URLs.
+    """
+    
+    def __init__(self, loop, maxsize):
+        self.done = threading.Event()
+        self._loop = loop
+        self._queue = asyncio.run_coroutine_threadsafe(self._make_queue(maxsize), loop).result()
+    
+    @staticmethod
+    async def _make_queue(maxsize):
+        # Created on the loop so the queue binds to it on every Python version
+        return asyncio.Queue(maxsize=maxsize)
+    
+    def put(self, item):
+        """
+        Queue an item from another thread, blocking while the queue is full
+        
+        Returns:
+            bool: False if the downloader has finished and the item was dropped
+        """
+        if self.done.is_set():
+            return False
+        
+        try:
+            future = asyncio.run_coroutine_threadsafe(self._queue.put(item), self._loop)
+        except RuntimeError:
+            # Event loop already closed
+            return False
+        
+        while True:
+            try:
+                future.result(timeout=0.5)
+                return True
+            except FuturesCancelledError:
+                # Event loop shut down before the item was queued
+                return False
+            except FuturesTimeoutError:
+                if self.done.is_set():
+                    future.cancel()
+                    return False
+    
+    def close(self, consumers):
+        """Signal end of input to each consumer"""
+        for _ in range(consumers):
+            if not self.put(None):
+                return
+    
+    async def get(self):
+        """Wait for the next item (None means no more input)"""
+        return await self._queue.get()
+
+
+# Scraper owned by a pool worker process (set up by _init_worker)
+_worker_scraper = None
+
+
+def _shutdown_worker():
+    """Finish downloads and close the browser when a worker process exits"""
+    scraper = _worker_scraper
+    try:
+        scraper.finish_downloads()
+        scraper.save_url_cache()
+    finally:
+        # Runs even when a SIGTERM interrupts the drain above
+        if scraper.driver:
+            scraper.driver.quit()
+            logger.info("WebDriver closed")
+
+
+def _stop_worker(signum, frame):
+    """SIGTERM handler: drop pending downloads and exit so finalizers run"""
+    if _worker_scraper is not None:
+        _worker_scraper.cancel_downloads()
+    raise SystemExit(1)
+
+
+def _init_worker(headless, images_per_food, max_connections):
+    """
+    Create the scraper and Chrome instance used by one worker process
+    
+    WebDriver instances are not thread-safe, so each process owns one driver
+    and reuses it for every food it is given.
+    
+    Args:
+        headless (bool): Run browser in headless mode
+        images_per_food (int): Number of images to download per food type
+        max_connections (int): Maximum concurrent image downloads
+    """
+    global _worker_scraper
+    
+    # Ctrl-C is handled by the parent, which terminates the pool; the
+    # SIGTERM handler then lets the finalizer below quit Chrome
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    signal.signal(signal.SIGTERM, _stop_worker)
+    
+    _worker_scraper = MyanmarFoodScraper(
+        headless=headless,
+        images_per_food=images_per_food,
+        max_connections=max_connections
+    )
+    Finalize(None, _shutdown_worker, exitpriority=10)
+    
+    try:
+        _worker_scraper.setup_driver()
+    except Exception:
+        # Already logged; the pool would respawn a worker that raises here
+        pass
+
+
+def _scrape_one_food_worker(food_name):
+    """
+    Scrape a single food with the worker process's browser
+    
+    Args:
+        food_name (str): Name of the Myanmar food
+    """
+    if _worker_scraper.driver is None:
+        logger.error(f"Skipping {food_name}: WebDriver is not available")
+        return
+    
+    try:
+        _worker_scraper.scrape_food_images(food_name)
+    except Exception as e:
+        logger.error(f"Error scraping {food_name}: {e}")
+
+
 class MyanmarFoodScraper:
-    def __init__(self, headless=False, images_per_food=50):
+    def __init__(self, headless=False, images_per_food=50, max_connections=100, browser_processes=4):
         """
         Initialize the Myanmar Food Scraper
         
         Args:
             headless (bool): Run browser in headless mode
             images_per_food (int): Number of images to download per food type
+            max_connections (int): Maximum concurrent image downloads
+            browser_processes (int): Number of parallel Chrome processes used by
+                scrape_all_foods (each opens a window unless headless)
         """
         self.headless = headless
         self.images_per_food = images_per_food
+        self.max_connections = max_connections
+        self.browser_processes = browser_processes
         self.base_folder = "Myanmar_Food_Images"
         
         # List of 20 popular Myanmar food types
@@ -59,24 +316,151 @@ class MyanmarFoodScraper:
         ]
         
         self.driver = None
+        
+        # Background download loop shared by every food this scraper handles
+        self._download_thread = None
+        self._download_loop = None
+        self._download_session = None
+        self._stop_downloads = None
+        self._pending_downloads = []
+        
+        # URLs already downloaded in this or previous runs
+        self.url_cache_path = os.path.join(self.base_folder, URL_CACHE_FILE)
+        self._seen = self.load_url_cache()
+        self._new_urls = set()
+        self._seen_lock = threading.Lock()
+        self._save_lock = threading.Lock()
+        self._unsaved_count = 0
+        atexit.register(self.save_url_cache)
+    
+    def _read_url_file(self, path):
+        """Read a JSON list of URLs (empty set if missing or unreadable)"""
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return set(json.load(f))
+        except FileNotFoundError:
+            return set()
+        except Exception as e:
+            logger.warning(f"Could not read URL cache {path}: {e}")
+            return set()
+    
+    def _write_url_file(self, path, urls):
+        """Atomically write a JSON list of URLs"""
+        os.makedirs(self.base_folder, exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(sorted(urls), f)
+        os.replace(tmp_path, path)
+    
+    def _url_cache_shards(self):
+        """Return paths of the per-process cache shards"""
+        try:
+            with os.scandir(self.base_folder) as entries:
+                return [e.path for e in entries if URL_CACHE_SHARD_RE.match(e.name)]
+        except FileNotFoundError:
+            return []
+    
+    def load_url_cache(self):
+        """
+        Load the set of previously downloaded image URLs
+        
+        Returns:
+            set: URLs from the cache file and all process shards
+        """
+        seen = self._read_url_file(self.url_cache_path)
+        for shard_path in self._url_cache_shards():
+            seen |= self._read_url_file(shard_path)
+        return seen
+    
+    def save_url_cache(self):
+        """
+        Write URLs downloaded by this process to its own cache shard
+        
+        Each process only ever writes its own shard, so parallel workers
+        cannot overwrite each other's entries.
+        """
+        with self._save_lock:
+            with self._seen_lock:
+                if not self._unsaved_count:
+                    return
+                new_urls = set(self._new_urls)
+                self._unsaved_count = 0
+            
+            # A shard left by an earlier process with the same pid is kept
+            shard_path = os.path.join(self.base_folder, f".url_cache.{os.getpid()}.json")
+            try:
+                self._write_url_file(shard_path, new_urls | self._read_url_file(shard_path))
+            except Exception as e:
+                logger.warning(f"Could not write URL cache {shard_path}: {e}")
+    
+    def compact_url_cache(self):
+        """
+        Merge all shards into the main cache file and delete them
+        
+        Only call this while no other scraper process is running.
+        """
+        self.save_url_cache()
+        shards = self._url_cache_shards()
+        if not shards:
+            return
+        
+        try:
+            self._write_url_file(self.url_cache_path, self.load_url_cache())
+            for shard_path in shards:
+                os.remove(shard_path)
+        except Exception as e:
+            logger.warning(f"Could not compact URL cache {self.url_cache_path}: {e}")
+    
+    def _mark_downloaded(self, img_url):
+        """
+        Record a downloaded URL
+        
+        Returns:
+            bool: True if enough new URLs have accumulated to flush the cache
+        """
+        with self._seen_lock:
+            self._seen.add(img_url)
+            self._new_urls.add(img_url)
+            self._unsaved_count += 1
+            return self._unsaved_count >= URL_CACHE_FLUSH_EVERY
     
     def setup_driver(self):
         """Set up Chrome WebDriver with options"""
         options = webdriver.ChromeOptions()
         
         if self.headless:
-            options.add_argument("--headless")
+            options.add_argument("--headless=new")
         
         # Additional options for better performance
         options.add_argument("--no-sandbox")
         options.add_argument("--disable-dev-shm-usage")
         options.add_argument("--disable-gpu")
         options.add_argument("--window-size=1920,1080")
+        options.add_argument(f"--user-agent={USER_AGENT}")
+        
+        # Don't download or decode images in the browser; only their src URLs are needed
+        options.add_experimental_option(
+            "prefs", {"profile.managed_default_content_settings.images": 2}
+        )
+        options.add_argument("--blink-settings=imagesEnabled=false")
+        
+        # Trim per-navigation overhead
+        options.add_argument("--disable-extensions")
+        options.add_argument("--disable-background-networking")
+        options.add_argument("--disable-sync")
+        options.add_argument("--mute-audio")
+        options.add_argument("--disable-features=Translate,BackForwardCache")
         
         try:
-            self.driver = webdriver.Chrome(
-                service=Service(ChromeDriverManager().install()), 
-                options=options
+            # Selenium Manager resolves and caches the driver (~/.cache/selenium)
+            self.driver = webdriver.Chrome(options=options)
+            # Missing-element lookups should fail fast; waits are explicit
+            self.driver.implicitly_wait(0)
+            
+            # Hide the navigator.webdriver flag on every page
+            self.driver.execute_cdp_cmd(
+                "Page.addScriptToEvaluateOnNewDocument",
+                {"source": "Object.defineProperty(navigator, 'webdriver', {get: () => undefined})"}
             )
             logger.info("WebDriver initialized successfully")
         except Exception as e:
@@ -89,112 +473,401 @@ class MyanmarFoodScraper:
         os.makedirs(folder_path, exist_ok=True)
         return folder_path
     
-    def get_image_urls(self, query):
+    def _wait_for_network_idle(self, timeout=2, quiet_period=0.5):
+        """
+        Wait until the page stops fetching resources or timeout expires
+        
+        Args:
+            timeout (float): Maximum number of seconds to wait
+            quiet_period (float): Seconds without new requests that count as idle
+        """
+        state = {"count": -1, "since": time.monotonic()}
+        
+        def is_idle(driver):
+            count = driver.execute_script(RESOURCE_COUNT_JS)
+            now = time.monotonic()
+            if count != state["count"]:
+                state["count"], state["since"] = count, now
+                return False
+            return now - state["since"] >= quiet_period
+        
+        try:
+            WebDriverWait(self.driver, timeout, poll_frequency=0.1).until(is_idle)
+        except TimeoutException:
+            pass
+    
+    def _extract_image_urls(self):
         """
-        Scrape image URLs from Google Images
+        Collect valid image URLs currently on the page
+        
+        Returns:
+            list: Image URLs in page order (may contain duplicates)
+        """
+        # One CDP call instead of two get_attribute round-trips per <img>;
+        # data: URIs and non-http URLs are dropped by VALID_IMAGE_URL_RE
+        result = self.driver.execute_cdp_cmd(
+            "Runtime.evaluate",
+            {"expression": EXTRACT_IMAGE_URLS_EXPR, "returnByValue": True}
+        )
+        raw_urls = json.loads(result["result"]["value"])
+        return [u for u in raw_urls if VALID_IMAGE_URL_RE.match(u)]
+    
+    def iter_image_urls(self, query):
+        """
+        Scrape image URLs from Google Images, yielding them as the page loads
         
         Args:
             query (str): Search query
             
-        Returns:
-            list: List of image URLs
+        Yields:
+            list: Image URLs not seen in an earlier batch for this query
         """
         # Construct Google Images search URL
         search_query = f"{query} Myanmar food"  # Add context for better results
         url = f"https://www.google.com/search?tbm=isch&q={search_query}"
         
+        found = {}
+        
+        def new_urls():
+            batch = [u for u in dict.fromkeys(self._extract_image_urls()) if u not in found]
+            found.update(dict.fromkeys(batch))
+            return batch
+        
         try:
             # Open Google Images
             self.driver.get(url)
             logger.info(f"Searching for: {search_query}")
-            time.sleep(3)
+            
+            # Wait until the first real image is present instead of sleeping
+            WebDriverWait(self.driver, 10).until(
+                EC.presence_of_element_located((By.CSS_SELECTOR, 'img[src^="http"]'))
+            )
+            
+            # The default resource timing buffer (250 entries) would fill up
+            # and make the network look idle
+            self.driver.execute_script("performance.setResourceTimingBufferSize(100000)")
+            
+            yield new_urls()
             
             # Scroll to load more images
             scroll_count = 15  # Increased scroll count for more images
             for i in range(scroll_count):
                 self.driver.execute_script("window.scrollBy(0,1000)")
-                time.sleep(2)
-                
-                # Try to click "Show more results" button if it appears
-                try:
-                    show_more_button = self.driver.find_element(
-                        By.XPATH, "//input[@value='Show more results']"
-                    )
-                    if show_more_button.is_displayed():
-                        show_more_button.click()
-                        time.sleep(3)
-                except:
-                    pass
-            
-            # Wait for images to load
-            WebDriverWait(self.driver, 30).until(
-                EC.presence_of_all_elements_located((By.TAG_NAME, "img"))
-            )
-            
-            # Collect image URLs
-            image_elements = self.driver.find_elements(By.TAG_NAME, "img")
-            
-            # Filter and collect valid image URLs
-            image_urls = []
-            for img in image_elements:
-                src = img.get_attribute("src")
-                data_src = img.get_attribute("data-src")
+                self._wait_for_network_idle(timeout=2)
                 
-                # Check both src and data-src attributes
-                url_to_use = src or data_src
+                # Click "Show more results" if it is visible (single round-trip)
+                if self.driver.execute_script(CLICK_SHOW_MORE_JS):
+                    self._wait_for_network_idle(timeout=3)
                 
-                if url_to_use and url_to_use.startswith("http"):
-                    # Skip base64 encoded images and very small images
-                    if not url_to_use.startswith("data:"):
-                        image_urls.append(url_to_use)
-            
-            # Remove duplicates while preserving order
-            image_urls = list(dict.fromkeys(image_urls))
-            logger.info(f"Found {len(image_urls)} unique image URLs for {query}")
-            
-            return image_urls
+                yield new_urls()
             
         except Exception as e:
             logger.error(f"Error getting image URLs for {query}: {e}")
-            return []
+        
+        finally:
+            logger.info(f"Found {len(found)} unique image URLs for {query}")
     
-    def download_image(self, img_url, file_path):
+    async def _download_one(self, session, img_url, file_stem):
         """
         Download single image
         
         Args:
+            session (aiohttp.ClientSession): Shared HTTP session
             img_url (str): Image URL
-            file_path (str): Path to save the image
+            file_stem (str): Path to save the image, without extension
             
         Returns:
             bool: True if successful, False otherwise
         """
+        # Skip URLs already downloaded in this or a previous run
+        if img_url in self._seen:
+            logger.debug(f"Skipping cached image URL {img_url}")
+            return False
+        
+        part_path = None
         try:
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-            }
-            
-            response = requests.get(img_url, headers=headers, timeout=10)
-            response.raise_for_status()
+            timeout = aiohttp.ClientTimeout(total=DOWNLOAD_TIMEOUT)
+            async with session.get(img_url, timeout=timeout) as response:
+                response.raise_for_status()
+                
+                # Check the magic bytes before writing anything to disk;
+                # servers often send generic or wrong content types
+                try:
+                    head = await response.content.readexactly(MAGIC_HEADER_SIZE)
+                except asyncio.IncompleteReadError:
+                    return False
+                
+                extension = _sniff_image_extension(head)
+                if extension is None:
+                    return False
+                
+                file_path = file_stem + extension
+                part_path = f"{file_path}.part"
+                
+                # Stream the body to a .part file instead of buffering it in
+                # memory; it only gets its real name once complete
+                total = len(head)
+                with open(part_path, 'wb', buffering=1 << 20) as f:
+                    f.write(head)
+                    async for chunk in response.content.iter_chunked(CHUNK_SIZE):
+                        total += len(chunk)
+                        if total > MAX_IMAGE_BYTES:
+                            break
+                        f.write(chunk)
+                
+                if total > MAX_IMAGE_BYTES:
+                    logger.warning(f"Skipped oversized image from {img_url}")
+                    return False
+                
+                os.replace(part_path, file_path)
             
-            # Check if the response contains image data
-            content_type = response.headers.get('content-type', '')
-            if 'image' not in content_type.lower():
+            # Encoding is CPU work; run it off the event loop so other
+            # downloads keep progressing
+            loop = asyncio.get_running_loop()
+            try:
+                await loop.run_in_executor(None, _convert_to_webp, file_path)
+            except Exception as e:
+                logger.warning(f"Discarding unreadable image from {img_url}: {e}")
+                if os.path.exists(file_path):
+                    os.remove(file_path)
                 return False
             
-            with open(file_path, 'wb') as f:
-                f.write(response.content)
-            
+            if self._mark_downloaded(img_url):
+                # Disk I/O; keep it off the event loop
+                await loop.run_in_executor(None, self.save_url_cache)
             return True
             
         except Exception as e:
             logger.warning(f"Failed to download image from {img_url}: {e}")
             return False
+        
+        finally:
+            # Failed, oversized or cancelled downloads leave no partial file
+            if part_path and os.path.exists(part_path):
+                os.remove(part_path)
+    
+    async def _check_url(self, session, img_url):
+        """
+        Check with a HEAD request whether a URL looks like a downloadable image
+        
+        Args:
+            session (aiohttp.ClientSession): Shared HTTP session
+            img_url (str): Image URL
+            
+        Returns:
+            bool: True if the URL should be downloaded
+        """
+        try:
+            timeout = aiohttp.ClientTimeout(total=HEAD_TIMEOUT)
+            async with session.head(img_url, timeout=timeout, allow_redirects=True) as response:
+                if response.status >= 400:
+                    return False
+                
+                # Some CDNs serve images as octet-stream; magic bytes are
+                # checked during the download
+                content_type = response.headers.get('content-type', '').lower()
+                if not content_type.startswith(('image/', 'application/octet-stream')):
+                    return False
+                
+                # Not every server sends a length for HEAD; only reject known bad sizes
+                content_length = response.content_length
+                if content_length is not None and not MIN_IMAGE_BYTES <= content_length <= MAX_IMAGE_BYTES:
+                    return False
+                
+                return True
+                
+        except Exception as e:
+            logger.debug(f"HEAD check failed for {img_url}: {e}")
+            return False
+    
+    def _scan_existing_images(self, folder_path, food_name):
+        """
+        Find images already saved for a food by a previous run
+        
+        Only completed images count: downloads and conversions write to
+        .part/.tmp files first, and leftovers from interrupted runs are removed.
+        
+        Args:
+            folder_path (str): Folder for this food type
+            food_name (str): Name of the food, used in file names
+            
+        Returns:
+            tuple: (number of existing images, highest existing file index)
+        """
+        name_re = re.compile(rf'^{re.escape(food_name)}_(\d+)\.(?:jpg|png|webp)$')
+        count = 0
+        max_index = 0
+        with os.scandir(folder_path) as entries:
+            for entry in entries:
+                if not entry.is_file():
+                    continue
+                if entry.name.endswith(('.part', '.tmp')):
+                    os.remove(entry.path)
+                    continue
+                match = name_re.match(entry.name)
+                if match:
+                    count += 1
+                    max_index = max(max_index, int(match.group(1)))
+        return count, max_index
+    
+    def _file_path_template(self, folder_path, food_name):
+        """
+        Build a %-style template for image file paths of a food
+        
+        The extension is left off; it comes from the downloaded bytes.
+        
+        Args:
+            folder_path (str): Folder for this food type
+            food_name (str): Name of the food, used in file names
+            
+        Returns:
+            str: Template taking the file index
+        """
+        escaped_name = food_name.replace('%', '%%')
+        return os.path.join(folder_path.replace('%', '%%'), f"{escaped_name}_%d")
+    
+    async def _serve_downloads(self, ready):
+        """
+        Run the download event loop until finish_downloads is called
+        
+        Args:
+            ready (threading.Event): Set once the loop and session are usable
+        """
+        self._download_loop = asyncio.get_running_loop()
+        self._stop_downloads = asyncio.Event()
+        connector = aiohttp.TCPConnector(
+            limit=self.max_connections,
+            limit_per_host=CONNECTIONS_PER_HOST,
+            ttl_dns_cache=DNS_CACHE_TTL
+        )
+        
+        async with aiohttp.ClientSession(connector=connector, headers=REQUEST_HEADERS) as session:
+            self._download_session = session
+            ready.set()
+            await self._stop_downloads.wait()
+        
+        self._download_session = None
+    
+    def start_downloads(self):
+        """Start the background event loop that downloads images for all foods"""
+        if self._download_thread is not None:
+            return
+        
+        ready = threading.Event()
+        self._download_thread = threading.Thread(
+            target=asyncio.run, args=(self._serve_downloads(ready),), daemon=True
+        )
+        self._download_thread.start()
+        ready.wait()
+    
+    def cancel_downloads(self):
+        """Abandon downloads that are queued or in progress"""
+        for future in self._pending_downloads:
+            future.cancel()
+    
+    def finish_downloads(self):
+        """Wait for all queued downloads, then stop the download loop"""
+        if self._download_thread is None:
+            return
+        
+        for future in self._pending_downloads:
+            try:
+                future.result()
+            except FuturesCancelledError:
+                pass
+            except Exception as e:
+                logger.error(f"Error downloading images: {e}")
+        self._pending_downloads = []
+        
+        self._download_loop.call_soon_threadsafe(self._stop_downloads.set)
+        self._download_thread.join()
+        self._download_thread = None
+    
+    async def _download_images(self, url_feed, folder_path, food_name, limit, start_index=1):
+        """
+        Pre-check and download image URLs as they arrive from the browser
+        
+        Stops once `limit` images have been saved or the feed is closed.
+        
+        Args:
+            url_feed (_UrlFeed): Source of image URLs
+            folder_path (str): Folder for this food type
+            food_name (str): Name of the food
+            limit (int): Maximum number of images to download
+            start_index (int): Number of the first new file, so reruns append
+                instead of overwriting existing images
+            
+        Returns:
+            int: Number of images downloaded
+        """
+        session = self._download_session
+        path_template = self._file_path_template(folder_path, food_name)
+        state = {"downloaded": 0, "downloading": 0, "next_index": start_index}
+        slots = asyncio.Condition()
+        workers = []
+        
+        def has_slot():
+            return state["downloaded"] + state["downloading"] < limit
+        
+        async def worker():
+            while state["downloaded"] < limit:
+                img_url = await url_feed.get()
+                if img_url is None:
+                    return
+                if img_url in self._seen or not await self._check_url(session, img_url):
+                    continue
+                
+                # Never have more downloads in flight than images still needed
+                async with slots:
+                    await slots.wait_for(lambda: has_slot() or state["downloaded"] >= limit)
+                    if state["downloaded"] >= limit:
+                        return
+                    state["downloading"] += 1
+                    index = state["next_index"]
+                    state["next_index"] += 1
+                
+                ok = await self._download_one(session, img_url, path_template % index)
+                
+                async with slots:
+                    state["downloading"] -= 1
+                    if ok:
+                        state["downloaded"] += 1
+                        if state["downloaded"] % 10 == 0:
+                            logger.info(f"Downloaded {state['downloaded']} images for {food_name}")
+                    if state["downloaded"] >= limit:
+                        # Target reached: stop the producer and idle workers
+                        url_feed.done.set()
+                        for task in workers:
+                            if task is not asyncio.current_task():
+                                task.cancel()
+                    slots.notify_all()
+        
+        try:
+            workers.extend(
+                asyncio.ensure_future(worker()) for _ in range(self.max_connections)
+            )
+            results = await asyncio.gather(*workers, return_exceptions=True)
+        except asyncio.CancelledError:
+            for task in workers:
+                task.cancel()
+            raise
+        finally:
+            url_feed.done.set()
+        
+        # Cancelled workers are expected; anything else is a bug worth seeing
+        for result in results:
+            if isinstance(result, Exception) and not isinstance(result, asyncio.CancelledError):
+                logger.error(f"Download worker for {food_name} failed: {result!r}")
+        
+        return state["downloaded"]
     
     def scrape_food_images(self, food_name):
         """
         Scrape images for a specific food type
         
+        Downloads continue in the background after this returns, so the next
+        food's browser work overlaps them; call finish_downloads to wait.
+        
         Args:
             food_name (str): Name of the Myanmar food
         """
@@ -203,68 +876,90 @@ class MyanmarFoodScraper:
         # Create folder for this food type
         folder_path = self.create_folder(food_name)
         
-        # Get image URLs
-        image_urls = self.get_image_urls(food_name)
-        
-        if not image_urls:
-            logger.warning(f"No images found for {food_name}")
+        # Resume: only fetch what's missing from a previous run
+        existing_count, max_index = self._scan_existing_images(folder_path, food_name)
+        remaining = self.images_per_food - existing_count
+        if remaining <= 0:
+            logger.info(f"Skipping {food_name}: already have {existing_count} images")
             return
+        if existing_count:
+            logger.info(f"Found {existing_count} existing images for {food_name}, fetching {remaining} more")
         
-        # Download images
-        downloaded_count = 0
-        for i, img_url in enumerate(image_urls[:self.images_per_food]):
-            try:
-                # Get file extension from URL
-                parsed_url = urlparse(img_url)
-                file_extension = os.path.splitext(parsed_url.path)[1]
-                
-                # Default to .jpg if no extension found
-                if not file_extension or file_extension not in ['.jpg', '.jpeg', '.png', '.webp']:
-                    file_extension = '.jpg'
-                
-                file_name = f"{food_name}_{i+1}{file_extension}"
-                file_path = os.path.join(folder_path, file_name)
-                
-                if self.download_image(img_url, file_path):
-                    downloaded_count += 1
-                    if downloaded_count % 10 == 0:
-                        logger.info(f"Downloaded {downloaded_count} images for {food_name}")
+        # Producer/consumer pipeline: Selenium stays on this thread and feeds
+        # URLs after every scroll, while the background loop downloads them
+        self.start_downloads()
+        url_feed = _UrlFeed(self._download_loop, maxsize=URL_QUEUE_SIZE)
+        download = asyncio.run_coroutine_threadsafe(
+            self._download_images(url_feed, folder_path, food_name, remaining, max_index + 1),
+            self._download_loop
+        )
+        
+        def log_completion(future):
+            if not future.cancelled() and future.exception() is None:
+                logger.info(f"Completed {food_name}: Downloaded {future.result()} images")
+        
+        download.add_done_callback(log_completion)
+        self._pending_downloads.append(download)
+        
+        urls_found = 0
+        try:
+            for batch in self.iter_image_urls(food_name):
+                for img_url in batch:
+                    if not url_feed.put(img_url):
+                        break
+                urls_found += len(batch)
                 
-            except Exception as e:
-                logger.warning(f"Error processing image {i+1} for {food_name}: {e}")
-                continue
+                # Enough images downloaded; stop scrolling early
+                if url_feed.done.is_set():
+                    break
+        except BaseException:
+            # Interrupted (e.g. Ctrl-C): drop this food's downloads right away
+            # instead of pushing end-of-input markers through a full queue
+            url_feed.done.set()
+            download.cancel()
+            raise
         
-        logger.info(f"Completed {food_name}: Downloaded {downloaded_count} images")
+        url_feed.close(self.max_connections)
+        
+        if not urls_found:
+            logger.warning(f"No images found for {food_name}")
     
     def scrape_all_foods(self):
         """Scrape images for all Myanmar food types"""
         logger.info("Starting Myanmar Food Image Scraping")
         logger.info(f"Will scrape {len(self.myanmar_foods)} food types")
         logger.info(f"Target: {self.images_per_food} images per food type")
+        logger.info(f"Using {self.browser_processes} parallel browser processes")
         
         # Create base folder
         os.makedirs(self.base_folder, exist_ok=True)
         
-        # Setup driver
-        self.setup_driver()
+        # Each worker process drives its own Chrome instance for all its foods.
+        # The pool is closed explicitly: Pool.__exit__ would terminate workers
+        # before they finish their background downloads.
+        pool = Pool(
+            processes=self.browser_processes,
+            initializer=_init_worker,
+            initargs=(self.headless, self.images_per_food, self.max_connections)
+        )
         
+        # Workers keep downloading after map returns, so join() is inside the
+        # try as well: Ctrl-C while waiting for them must still terminate
         try:
-            for i, food in enumerate(self.myanmar_foods, 1):
-                logger.info(f"Processing {i}/{len(self.myanmar_foods)}: {food}")
-                self.scrape_food_images(food)
-                
-                # Add delay between different food types to avoid being blocked
-                if i < len(self.myanmar_foods):
-                    time.sleep(5)
-                
+            pool.map(_scrape_one_food_worker, self.myanmar_foods, chunksize=1)
+            pool.close()
+            pool.join()
         except KeyboardInterrupt:
             logger.info("Scraping interrupted by user")
+            pool.terminate()
+            pool.join()
         except Exception as e:
             logger.error(f"Error during scraping: {e}")
-        finally:
-            if self.driver:
-                self.driver.quit()
-                logger.info("WebDriver closed")
+            pool.terminate()
+            pool.join()
+        
+        # All workers have exited; safe to merge their cache shards
+        self.compact_url_cache()
         
         logger.info("Myanmar Food Image Scraping completed!")
     
@@ -285,9 +980,14 @@ class MyanmarFoodScraper:
         
         try:
             self.scrape_food_images(food_name)
+        except KeyboardInterrupt:
+            logger.info("Scraping interrupted by user")
+            self.cancel_downloads()
         except Exception as e:
             logger.error(f"Error during scraping: {e}")
         finally:
+            self.finish_downloads()
+            self.compact_url_cache()
             if self.driver:
                 self.driver.quit()
                 logger.info("WebDriver closed")